@@ -1,7 +1,6 @@
-import json, jwt, uuid
-from datetime import datetime, timezone
-from django.http import JsonResponse
+import jwt, logging, time, uuid
 from rest_framework.views import APIView
+from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.permissions import AllowAny
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
@@ -9,11 +8,22 @@ from django.conf import settings
 from drf_spectacular.utils import extend_schema, inline_serializer
 from rest_framework import serializers
 
-from .helpers import b64_hmac_sha256, compare_signatures, is_fresh_timestamp, consume_nonce_once, validate_client_fields, store_refresh_token, is_refresh_token_valid, revoke_refresh_token
+from .helpers import hmac_sha256, string_to_sign, decode_signature, compare_signatures, encode_jwt, is_fresh_timestamp, validate_client_fields, issue_tokens_atomic, is_refresh_token_valid
 from .decorator import jwt_required
-from ...utils import success_response, error_response
+from ...parsers import OrjsonParser
+from ...utils import success_response, error_response, json_response
 from ...throttling import AuthTokenRateThrottle
 
+logger = logging.getLogger(__name__)
+
+
+# Token lifetimes in whole seconds, resolved once at import
+_ACCESS_TTL_S = int(settings.JWT_ACCESS_TTL.total_seconds())
+_REFRESH_TTL_S = int(settings.JWT_REFRESH_TTL.total_seconds())
+
+# Values of the "type" claim
+TOKEN_TYPE_ACCESS = "access"
+TOKEN_TYPE_REFRESH = "refresh"
 
 # Get JWT token for app authentication
 @extend_schema(
@@ -57,6 +67,7 @@ from ...throttling import AuthTokenRateThrottle
 class GetJWTTokenView(APIView):
     permission_classes = [AllowAny]  # No authentication required for getting token
     throttle_classes = [AuthTokenRateThrottle]  # Strict rate limiting: 5 requests per minute
+    parser_classes = [OrjsonParser, FormParser, MultiPartParser]  # orjson for JSON; form bodies still accepted
     
     """
     Client POSTs JSON:
@@ -85,57 +96,59 @@ class GetJWTTokenView(APIView):
         if not device_id or not ts or not nonce or not client_sig:
             return error_response("Missing fields", status=400)
 
-        if not validate_client_fields(device_id, ts, nonce, client_sig):
+        ts_int = validate_client_fields(device_id, ts, nonce, client_sig)
+        if ts_int is None:
             return error_response("Invalid fields", status=400)
 
         # 1) Check timestamp
-        if not is_fresh_timestamp(ts):
-            print("Stale or invalid timestamp!")
+        if not is_fresh_timestamp(ts_int):
+            logger.debug("Stale or invalid timestamp for device=%s", device_id)
             return error_response("Stale or invalid timestamp", status=422)
 
-        # 2) Check nonce uniqueness
-        if not consume_nonce_once(nonce, device_id):
-            print("Replay detected!")
-            return error_response("Replay detected", status=422)
+        # 2) Recompute server signature
+        client_digest = decode_signature(client_sig)
+        if client_digest is None:
+            logger.debug("Invalid HMAC for device=%s", device_id)
+            return error_response("Invalid HMAC", status=422)
 
-        # 3) Recompute server signature
-        string_to_sign = f"{device_id}/{ts}/{nonce}"
-        server_sig = b64_hmac_sha256(settings.HMAC_SHARED_SECRET, string_to_sign)
+        server_digest = hmac_sha256(string_to_sign(device_id, ts, nonce))
 
-        # 4) Constant-time compare
-        if not compare_signatures(server_sig, client_sig):
-            print("Invalid HMAC!")
+        # 3) Constant-time compare of the raw digests
+        if not compare_signatures(server_digest, client_digest):
+            logger.debug("Invalid HMAC for device=%s", device_id)
             return error_response("Invalid HMAC", status=422)
 
-        # 5) Issue JWT Access Token
-        now = datetime.now(timezone.utc)
+        # 4) Issue JWT Access Token
+        now = int(time.time())
         access_payload = {
-            "iat": int(now.timestamp()),
-            "exp": int((now + settings.JWT_ACCESS_TTL).timestamp()),
+            "iat": now,
+            "exp": now + _ACCESS_TTL_S,
             "device_id": device_id,
-            "type": "access"
+            "type": TOKEN_TYPE_ACCESS
         }
-        access_token = jwt.encode(access_payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+        access_token = encode_jwt(access_payload)
 
-        # 6) Issue JWT Refresh Token
+        # 5) Issue JWT Refresh Token
         refresh_jti = str(uuid.uuid4())
         refresh_payload = {
-            "iat": int(now.timestamp()),
-            "exp": int((now + settings.JWT_REFRESH_TTL).timestamp()),
+            "iat": now,
+            "exp": now + _REFRESH_TTL_S,
             "device_id": device_id,
             "jti": refresh_jti,
-            "type": "refresh"
+            "type": TOKEN_TYPE_REFRESH
         }
-        refresh_token = jwt.encode(refresh_payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
-        
-        # Store refresh token JTI
-        store_refresh_token(device_id, refresh_jti)
+        refresh_token = encode_jwt(refresh_payload)
+
+        # 6) Consume nonce and store refresh token JTI in one round-trip
+        if not issue_tokens_atomic(device_id, nonce, refresh_jti):
+            logger.debug("Replay detected for device=%s", device_id)
+            return error_response("Replay detected", status=422)
 
-        return JsonResponse({
+        return json_response({
             "access_token": access_token,
             "refresh_token": refresh_token,
             "token_type": "Bearer",
-            "expires_in": int(settings.JWT_ACCESS_TTL.total_seconds())
+            "expires_in": _ACCESS_TTL_S
         }, status=200)
 
 
@@ -208,6 +221,7 @@ class CheckAuthView(APIView):
 class RefreshJWTTokenView(APIView):
     permission_classes = [AllowAny]  # No authentication required for refresh
     throttle_classes = [AuthTokenRateThrottle]  # Rate limit: 5 requests per minute
+    parser_classes = [OrjsonParser, FormParser, MultiPartParser]  # orjson for JSON; form bodies still accepted
     
     """
     Client POSTs JSON:
@@ -238,7 +252,7 @@ class RefreshJWTTokenView(APIView):
             )
             
             # Verify it's a refresh token
-            if payload.get("type") != "refresh":
+            if payload.get("type") != TOKEN_TYPE_REFRESH:
                 return error_response("Invalid token type", status=422)
             
             device_id = payload.get("device_id")
@@ -249,19 +263,19 @@ class RefreshJWTTokenView(APIView):
                 return error_response("Refresh token revoked or invalid", status=401)
             
             # Issue new access token
-            now = datetime.now(timezone.utc)
+            now = int(time.time())
             access_payload = {
-                "iat": int(now.timestamp()),
-                "exp": int((now + settings.JWT_ACCESS_TTL).timestamp()),
+                "iat": now,
+                "exp": now + _ACCESS_TTL_S,
                 "device_id": device_id,
-                "type": "access"
+                "type": TOKEN_TYPE_ACCESS
             }
-            access_token = jwt.encode(access_payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+            access_token = encode_jwt(access_payload)
             
-            return JsonResponse({
+            return json_response({
                 "access_token": access_token,
                 "token_type": "Bearer",
-                "expires_in": int(settings.JWT_ACCESS_TTL.total_seconds())
+                "expires_in": _ACCESS_TTL_S
             }, status=200)
             
         except jwt.ExpiredSignatureError:
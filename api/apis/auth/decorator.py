@@ -1,35 +1,48 @@
-from functools import wraps
+import time
+from functools import lru_cache, wraps
 from django.http import JsonResponse
 from django.conf import settings
 import jwt
 
+
+# Our access tokens are a few hundred bytes; anything far larger is rejected unparsed
+_MAX_TOKEN_LENGTH = 4096
+
+# Verified tokens are memoized so repeat requests with the same access token skip
+# the signature check and JSON parse. Only successful decodes are cached; the
+# "exp" claim is re-checked on every hit.
+@lru_cache(maxsize=4096)
+def _decode_token(token: str) -> dict:
+    return jwt.decode(
+        token,
+        settings.JWT_SECRET,
+        algorithms=[settings.JWT_ALGORITHM],
+        options={"require": ["exp", "iat", "device_id"]},
+    )
+
 # Decorator to enforce JWT authentication on API views
 def jwt_required(view_func):
     @wraps(view_func)
     def wrapper(request, *args, **kwargs):
         auth_header = request.headers.get("Authorization", "")
-        if not auth_header.startswith("Bearer "):
+        if len(auth_header) < 8 or auth_header[:7] != "Bearer ":
             return JsonResponse(
                 {"error": "Unauthorized. Please provide a valid Bearer token in the Authorization header."},
                 status=401
             )
 
-        token = auth_header.split(" ", 1)[1].strip()
+        token = auth_header[7:].strip()
+        if len(token) > _MAX_TOKEN_LENGTH:
+            return JsonResponse({"error": "Invalid token"}, status=401)
+
         try:
-            jwt.decode(
-                token,
-                settings.JWT_SECRET,
-                algorithms=[settings.JWT_ALGORITHM],
-                options={"require": ["exp", "iat", "device_id"]},
-            )
+            payload = _decode_token(token)
+            if payload["exp"] <= time.time():
+                raise jwt.ExpiredSignatureError("Signature has expired")
         except jwt.ExpiredSignatureError:
-            # return JsonResponse({"error": "Token expired"}, status=401)
-            print("[WARNING] Expired token used.")
-
+            return JsonResponse({"error": "Token expired"}, status=401)
         except jwt.InvalidTokenError:
-            # return JsonResponse({"error": "Invalid token"}, status=401)
-            print("[WARNING] Invalid token used.")
+            return JsonResponse({"error": "Invalid token"}, status=401)
 
         return view_func(request, *args, **kwargs)
     return wrapper
-
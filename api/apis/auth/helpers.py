@@ -1,104 +1,161 @@
-import re
-import hmac, hashlib, base64, time
+import hmac, base64, binascii, json, logging, time
+import jwt
 
 from django.conf import settings
-from ...utils import set_cache
+from django.core.cache import cache
+from django_redis import get_redis_connection
 
+logger = logging.getLogger(__name__)
 
-# Strict Base64 regex
-_BASE64_RE = re.compile(
-    r"^(?:[A-Za-z0-9+/]{4})*"        # groups of 4 valid chars
-    r"(?:[A-Za-z0-9+/]{2}==|"        # or 2 chars + '=='
-    r"[A-Za-z0-9+/]{3}=)?$"          # or 3 chars + '='
-)
 
-# HMAC-SHA256 with Base64 encoding
-def b64_hmac_sha256(secret: str, msg: str) -> str:
-    digest = hmac.new(secret.encode("ascii"), msg.encode("ascii"), hashlib.sha256).digest()
-    return base64.b64encode(digest).decode("ascii")
+# Consume the nonce (SET NX) and, only if it was unused, point the device's refresh
+# key at the new JTI (replacing any earlier one). Runs server-side as one atomic
+# command: KEYS = [nonce_key, refresh_key], ARGV = [nonce_value, nonce_ttl, refresh_ttl, jti]
+_ISSUE_TOKENS_LUA = """
+if redis.call('SET', KEYS[1], ARGV[1], 'NX', 'EX', ARGV[2]) then
+    redis.call('SET', KEYS[2], ARGV[4], 'EX', ARGV[3])
+    return 1
+end
+return 0
+"""
 
-# Compare HMAC signatures
-def compare_signatures(a: str, b: str) -> bool:
-    # Normalize to ASCII bytes
-    try:
-        return hmac.compare_digest(a.encode("ascii"), b.encode("ascii"))
-    except UnicodeEncodeError:
+
+# Standard Base64 alphabet plus padding, used as a bytes.translate() delete table
+_BASE64_CHARS = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/="
+
+# Strict Base64 check: only alphabet chars, length multiple of 4, padding (max 2) at the end
+def is_base64(value: str) -> bool:
+    if not value.isascii():
+        return False
+    raw = value.encode("ascii")
+    if len(raw) % 4 or raw.translate(None, _BASE64_CHARS):
         return False
+    body = raw.rstrip(b"=")
+    return len(raw) - len(body) <= 2 and b"=" not in body
+
+# Shared secret encoded once at import
+_SECRET_BYTES = settings.HMAC_SHARED_SECRET.encode("ascii")
+
+# Raw HMAC-SHA256 digest (keyed with HMAC_SHARED_SECRET)
+def hmac_sha256(msg: bytes) -> bytes:
+    # One-shot hmac.digest() runs entirely in OpenSSL's C fast path
+    return hmac.digest(_SECRET_BYTES, msg, "sha256")
+
+# Bytes signed by the client: b"{device_id}/{timestamp}/{nonce}" (fields already validated as ASCII)
+def string_to_sign(device_id: str, ts: str, nonce: str) -> bytes:
+    return b"/".join((device_id.encode("ascii"), ts.encode("ascii"), nonce.encode("ascii")))
 
-# Check if timestamp is within allowed drift
-def is_fresh_timestamp(ts: str) -> bool:
+# JWT signing key and the constant HS256 header segment, encoded once at import.
+# The keyed HMAC template is copied per token so the key schedule is not redone.
+_JWT_SECRET_BYTES = settings.JWT_SECRET.encode("utf-8")
+_JWT_HMAC_TEMPLATE = hmac.new(_JWT_SECRET_BYTES, digestmod="sha256")
+_JWT_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+
+# Encode a JWT; HS256 tokens are assembled directly (header.payload.signature)
+def encode_jwt(payload: dict) -> str:
+    if settings.JWT_ALGORITHM != "HS256":
+        return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+    body = base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode("utf-8")).rstrip(b"=")
+    signing_input = _JWT_HEADER_B64 + b"." + body
+    ctx = _JWT_HMAC_TEMPLATE.copy()
+    ctx.update(signing_input)
+    sig = base64.urlsafe_b64encode(ctx.digest()).rstrip(b"=")
+    return (signing_input + b"." + sig).decode("ascii")
+
+# Decode a client-supplied Base64 signature to raw bytes (None if malformed)
+def decode_signature(sig: str) -> bytes | None:
     try:
-        ts = int(ts)
-    except ValueError:
-        return False
-    now = int(time.time())
-    return abs(now - ts) <= settings.HMAC_ALLOWED_DRIFT_SECONDS
+        return base64.b64decode(sig, validate=True)
+    except (binascii.Error, ValueError):
+        return None
 
-# Store nonce to prevent replay attacks
-def consume_nonce_once(nonce: str, device_id: str) -> bool:
-    """
-    Returns True if nonce was not used before (stores it in cache), False if replayed.
-    """
-    key = f"hmac_nonce:{nonce}"
-    value = f"device:{device_id}"
+# Compare raw HMAC digests in constant time
+def compare_signatures(a: bytes, b: bytes) -> bool:
+    return hmac.compare_digest(a, b)
+
+# Check if timestamp (already parsed by validate_client_fields) is within allowed drift
+def is_fresh_timestamp(ts: int) -> bool:
+    drift = settings.HMAC_ALLOWED_DRIFT_SECONDS
+    return -drift <= int(time.time()) - ts <= drift
 
-    return set_cache(key, value, settings.HMAC_NONCE_TTL_SECONDS)
+# The auth keys are read/written on the raw Redis client, so they go through the
+# cache's make_key() to keep the KEY_PREFIX/VERSION namespace of the Django cache
+def _nonce_key(nonce: str) -> str:
+    return cache.make_key(f"hmac_nonce:{nonce}")
+
+# One refresh key per device holding the JTI of its current refresh token
+def _refresh_key(device_id: str) -> str:
+    return cache.make_key(f"refresh_token:{device_id}")
+
+# Bounds for client-supplied fields (inclusive)
+_DEVICE_ID_MIN_LEN, _DEVICE_ID_MAX_LEN = 4, 128
+_NONCE_MIN_LEN, _NONCE_MAX_LEN = 16, 64
+_SIG_MIN_LEN, _SIG_MAX_LEN = 16, 64
+_TS_MIN, _TS_MAX = 1735689600, 4793846400  # 2025-01-01 .. 2125-01-01
 
 # Validate client-supplied fields(payload)
-def validate_client_fields(device_id: str, ts: str, nonce: str, sig: str) -> bool:
+def validate_client_fields(device_id: str, ts: str, nonce: str, sig: str) -> int | None:
     """
     Basic sanity checks on client-supplied fields
     .
-    Length limits, Base64 format, timestamp range.
+    Returns the parsed timestamp if all fields are valid, otherwise None.
+    Length limits, ASCII-only, Base64 format, timestamp range.
     4 <= device_id <= 128 chars
     16 <= nonce <= 64 chars
     16 <= sig <= 64 chars (Base64)
     1735689600 <= ts <= 4793846400  (2025-01-01 .. 2125-01-01)
     """
-    if not (4 <= len(device_id) <= 128):
-        print("Invalid device_id length:", len(device_id))
-        print("Device length should be between 4 and 128 characters.")
-        return False
-    if not (16 <= len(nonce) <= 64):
-        print("Invalid nonce length:", len(nonce))
-        print("Nonce length should be between 16 and 64 characters.")
-        return False
-    if not _BASE64_RE.match(sig):
-        print("Invalid sig format:", sig)
-        print("Signature must be a valid Base64 string.")
-        return False
-    try:
+    # Cheap length gates first, then the character checks; stops at the first failure
+    if (
+        _DEVICE_ID_MIN_LEN <= len(device_id) <= _DEVICE_ID_MAX_LEN
+        and _NONCE_MIN_LEN <= len(nonce) <= _NONCE_MAX_LEN
+        and _SIG_MIN_LEN <= len(sig) <= _SIG_MAX_LEN
+        and device_id.isascii()
+        and nonce.isascii()
+        and ts.isascii()
+        and ts.isdigit()
+        and is_base64(sig)
+    ):
         ts_int = int(ts)
-        # Reject far-future/ancient timestamps (basic sanity)
-        if ts_int < 1735689600 or ts_int > 4793846400:  # (2025-01-01 to 2125-01-01)
-            print("Timestamp out of range:", ts_int)
-            print("Timestamp must be between 1735689600 and 4793846400 which is time between 2025-01-01 to 2125-01-01.")
-            return False
-    except ValueError:
-        print("Invalid timestamp format:", ts)
-        print("Timestamp must be an integer representing epoch seconds.")
-        return False
-    return True
+        if _TS_MIN <= ts_int <= _TS_MAX:
+            return ts_int
+    logger.debug(
+        "Invalid client fields: device_id len=%d, nonce len=%d, sig len=%d, ts=%r",
+        len(device_id), len(nonce), len(sig), ts,
+    )
+    return None
 
-# Store refresh token to track active sessions
-def store_refresh_token(device_id: str, token_jti: str) -> bool:
+# Consume nonce and store refresh token in a single Redis round-trip
+def issue_tokens_atomic(device_id: str, nonce: str, refresh_jti: str) -> bool:
     """
-    Stores the refresh token JTI (JWT ID) for the device.
-    Returns True if stored successfully.
+    Marks the nonce as used and stores the refresh token JTI for the device.
+    Returns True on success, False if the nonce was replayed (nothing is stored)
+    or Redis is unavailable.
     """
-    key = f"refresh_token:{device_id}"
-    return set_cache(key, token_jti, settings.JWT_REFRESH_TTL.total_seconds())
+    try:
+        r = get_redis_connection("default")
+        return bool(r.eval(
+            _ISSUE_TOKENS_LUA, 2,
+            _nonce_key(nonce), _refresh_key(device_id),
+            f"device:{device_id}", settings.HMAC_NONCE_TTL_SECONDS,
+            int(settings.JWT_REFRESH_TTL.total_seconds()), refresh_jti,
+        ))
+    except Exception as e:
+        logger.warning("[Redis] issue_tokens_atomic error for device=%s: %s", device_id, e)
+        return False
 
 # Check if refresh token is valid and not revoked
 def is_refresh_token_valid(device_id: str, token_jti: str) -> bool:
     """
-    Validates if the refresh token JTI matches the stored one for the device.
-    Returns True if valid, False if revoked or mismatched.
+    Validates that the refresh token JTI is the device's current one.
+    Returns True if valid, False if revoked, superseded by a newer token or expired.
     """
-    from ...utils import get_cache
-    key = f"refresh_token:{device_id}"
-    stored_jti = get_cache(key)
-    return stored_jti == token_jti if stored_jti else False
+    try:
+        stored_jti = get_redis_connection("default").get(_refresh_key(device_id))
+    except Exception as e:
+        logger.warning("[Redis] is_refresh_token_valid error for device=%s: %s", device_id, e)
+        return False
+    return stored_jti is not None and hmac.compare_digest(stored_jti, str(token_jti).encode("utf-8"))
 
 # Revoke refresh token
 def revoke_refresh_token(device_id: str) -> bool:
@@ -106,6 +163,9 @@ def revoke_refresh_token(device_id: str) -> bool:
     Revokes the refresh token for a device by removing it from cache.
     Returns True if successfully revoked.
     """
-    from ...utils import delete_cache
-    key = f"refresh_token:{device_id}"
-    return delete_cache(key)
+    try:
+        get_redis_connection("default").delete(_refresh_key(device_id))
+        return True
+    except Exception as e:
+        logger.warning("[Redis] revoke_refresh_token error for device=%s: %s", device_id, e)
+        return False
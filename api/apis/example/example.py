@@ -7,25 +7,26 @@ template. Copy, rename, and adapt for your project-specific resources.
 Patterns demonstrated:
 - DRF APIView with response helpers
 - HMAC/JWT auth via @jwt_required decorator
-- Per-endpoint throttling
+- Per-endpoint throttling (separate read/write scopes via ReadWriteThrottleMixin)
 - Paginated list responses
-- Cache-aside reads
+- Cache-aside reads (pre-serialized JSON served straight from Redis)
 - OpenAPI schema annotations
 """
+from django.http import HttpResponse
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
 from drf_spectacular.utils import extend_schema
 
-from ...utils import success_response, error_response, paginated_response, pagination_params, get_cache, set_cache
-from ...throttling import ContentListingRateThrottle, DataModificationRateThrottle
+from ...utils import success_response, error_response, paginated_response, pagination_params, get_raw_cache, set_raw_cache, json_dumps
+from ...throttling import ReadWriteThrottleMixin
 from ...apis.auth.decorator import jwt_required
 
 
 @extend_schema(tags=["Example"])
 @method_decorator(csrf_exempt, name="dispatch")
-class ExampleListView(APIView):
+class ExampleListView(ReadWriteThrottleMixin, APIView):
     """
     GET  /api/v1/example/        — list all items (paginated, cached)
     POST /api/v1/example/        — create a new item (jwt required)
@@ -33,15 +34,13 @@ class ExampleListView(APIView):
     permission_classes = [AllowAny]
 
     def get(self, request):
-        throttle = ContentListingRateThrottle()
-        throttle.allow_request(request, self)
-
         page, page_size = pagination_params(request)
 
-        cache_key = f"example_list:{page}:{page_size}"
-        cached = get_cache(cache_key)
+        # The cached value is the complete response body, so a hit skips unpickling and JSON rendering
+        cache_key = f"example_list_json:{page}:{page_size}"
+        cached = get_raw_cache(cache_key)
         if cached is not None:
-            return success_response("Items retrieved (cached)", data=cached)
+            return HttpResponse(cached, content_type="application/json")
 
         # TODO: Replace with your queryset
         # items = MyModel.objects.filter(is_active=True).order_by("-created_at")
@@ -53,14 +52,12 @@ class ExampleListView(APIView):
         data = []
 
         result = paginated_response(data, total=total, page=page, page_size=page_size)
-        set_cache(cache_key, result, timeout=60 * 5)
+        body = json_dumps({"success": True, "message": "Items retrieved (cached)", "data": result})
+        set_raw_cache(cache_key, body, timeout=60 * 5)
         return success_response("Items retrieved", data=result)
 
     @jwt_required
     def post(self, request):
-        throttle = DataModificationRateThrottle()
-        throttle.allow_request(request, self)
-
         # TODO: Validate input and create your model instance
         # serializer = MySerializer(data=request.data)
         # if not serializer.is_valid():
@@ -73,7 +70,7 @@ class ExampleListView(APIView):
 
 @extend_schema(tags=["Example"])
 @method_decorator(csrf_exempt, name="dispatch")
-class ExampleDetailView(APIView):
+class ExampleDetailView(ReadWriteThrottleMixin, APIView):
     """
     GET    /api/v1/example/<pk>/  — retrieve a single item
     PUT    /api/v1/example/<pk>/  — update an item (jwt required)
@@ -82,9 +79,6 @@ class ExampleDetailView(APIView):
     permission_classes = [AllowAny]
 
     def get(self, request, pk):
-        throttle = ContentListingRateThrottle()
-        throttle.allow_request(request, self)
-
         # TODO: Fetch your model instance
         # instance = get_object_or_404(MyModel, pk=pk, is_active=True)
         # return success_response("Item retrieved", data=MySerializer(instance).data)
@@ -93,9 +87,6 @@ class ExampleDetailView(APIView):
 
     @jwt_required
     def put(self, request, pk):
-        throttle = DataModificationRateThrottle()
-        throttle.allow_request(request, self)
-
         # TODO: Update your model instance
         # instance = get_object_or_404(MyModel, pk=pk)
         # serializer = MySerializer(instance, data=request.data, partial=True)
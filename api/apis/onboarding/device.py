@@ -6,8 +6,9 @@ from django.views.decorators.csrf import csrf_exempt
 from drf_spectacular.utils import extend_schema, OpenApiExample
 
 from api.models import UserProfile, Device
-from .serializers import DeviceRegistrationSerializer, DeviceSerializer
-from ...utils import success_response, error_response
+from .serializers import DeviceRegistrationSerializer, DeviceSerializer, new_device_payload
+from ...queries import DEVICE_CACHE_KEY, DEVICE_CACHE_TTL
+from ...utils import success_response, error_response, get_cache, set_cache
 from ...throttling import DataModificationRateThrottle
 
 
@@ -63,24 +64,27 @@ class RegisterDeviceView(APIView):
         
         validated_data = serializer.validated_data
         device_id = validated_data['device_id']
+
+        cache_key = DEVICE_CACHE_KEY.format(device_id)
+        cached = get_cache(cache_key)
+        if cached is not None:
+            return success_response('Device already registered', data=cached)
         
-        # Check if device already exists
-        existing_device = Device.objects.select_related('profile').filter(device_id=device_id).first()
-        if existing_device:
-            device_serializer = DeviceSerializer(existing_device)
-            return success_response('Device already registered', data=device_serializer.data)
-        
-        # Step 1: Create UserProfile with blank data
-        user_profile = UserProfile.objects.create()
-        
-        # Step 2: Create Device and bind to UserProfile
-        device = Device.objects.create(
+        # Fetch the device, or create it together with a blank UserProfile.
+        # get_or_create runs the insert in a savepoint and only calls the profile
+        # factory on a miss, so a registration race never leaves an orphan profile.
+        device, created = Device.objects.select_related('profile').get_or_create(
             device_id=device_id,
-            device_type=validated_data.get('device_type', ''),
-            app_version=validated_data.get('app_version', ''),
-            region=validated_data.get('region', ''),
-            profile=user_profile
+            defaults={
+                'device_type': validated_data.get('device_type', ''),
+                'app_version': validated_data.get('app_version', ''),
+                'region': validated_data.get('region', ''),
+                'profile': UserProfile.objects.create,
+            },
         )
-        
-        device_serializer = DeviceSerializer(device)
-        return success_response('Device registered successfully', data=device_serializer.data, status=201)
+
+        data = DeviceSerializer(device).data if not created else new_device_payload(device)
+        set_cache(cache_key, data, DEVICE_CACHE_TTL)
+        if not created:
+            return success_response('Device already registered', data=data)
+        return success_response('Device registered successfully', data=data, status=201)
@@ -24,6 +24,36 @@ class DeviceSerializer(serializers.ModelSerializer):
         fields = ["id", "device_id", "device_type", "app_version", "region", "profile", "created_at"]
 
 
+# Formats datetimes exactly like the ModelSerializer fields above
+_datetime_field = serializers.DateTimeField()
+
+def new_device_payload(device: Device) -> dict:
+    """
+    Same shape as DeviceSerializer(device).data, built directly.
+
+    Used for freshly registered devices, whose profile holds only defaults,
+    to skip the nested ModelSerializer traversal.
+    """
+    profile = device.profile
+    return {
+        "id": device.id,
+        "device_id": device.device_id,
+        "device_type": device.device_type,
+        "app_version": device.app_version,
+        "region": device.region,
+        "profile": {
+            "id": profile.id,
+            "name": profile.name,
+            "email": profile.email,
+            "avatar_url": profile.avatar_url,
+            "is_verified": profile.is_verified,
+            "metadata": profile.metadata,
+            "created_at": _datetime_field.to_representation(profile.created_at),
+        },
+        "created_at": _datetime_field.to_representation(device.created_at),
+    }
+
+
 # ---------------------------------------------------------------------------
 # TODO: Add your project-specific serializers below, e.g.:
 # ---------------------------------------------------------------------------
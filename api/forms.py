@@ -1,4 +1,5 @@
 from django import forms
+from django.conf import settings
 from django.contrib.auth import authenticate
 from .models import User
 
@@ -9,28 +10,51 @@ ROLE_CHOICES = [
     ("superuser", "Superuser"),
 ]
 
+# Shared widget instances for the CMS user forms
+_FORM_GROUP_INPUT = forms.TextInput(attrs={"class": "form-group"})
+_FORM_CONTROL_INPUT = forms.TextInput(attrs={"class": "form-control"})
+_FORM_CONTROL_PASSWORD = forms.PasswordInput(attrs={"class": "form-control"})
+
 
 class UserSigninForm(forms.Form):
     username = forms.CharField(
         label="Username",
         max_length=100,
-        widget=forms.TextInput(attrs={"class": "form-control"}),
+        widget=_FORM_CONTROL_INPUT,
     )
     password = forms.CharField(
         label="Password",
         min_length=4,
-        widget=forms.PasswordInput(attrs={"class": "form-control"}),
+        widget=_FORM_CONTROL_PASSWORD,
     )
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.user_cache = None
+
     def clean(self, *args, **kwargs):
         username = self.cleaned_data.get("username")
         password = self.cleaned_data.get("password")
         if username and password:
-            user = authenticate(username=username, password=password)
-            if not user:
+            # Opt-in fast path: reject unknown and soft-deleted usernames with one
+            # lookup instead of running the hasher (see settings)
+            if settings.SKIP_TIMING_EQUALIZATION:
+                found = list(User.objects.filter(username=username).values_list("deleted_at", flat=True)[:1])
+                if not found:
+                    raise forms.ValidationError("Incorrect username or password")
+                if found[0] is not None:
+                    raise forms.ValidationError("Invalid user")
+            self.user_cache = authenticate(username=username, password=password)
+            if not self.user_cache:
                 raise forms.ValidationError("Incorrect username or password")
+            if self.user_cache.deleted_at is not None:
+                raise forms.ValidationError("Invalid user")
         return super().clean(*args, **kwargs)
 
+    def get_user(self):
+        """The user authenticated by clean(); the view logs it in without hashing again."""
+        return self.user_cache
+
     class Meta:
         model = User
         fields = ["username", "password"]
@@ -38,15 +62,15 @@ class UserSigninForm(forms.Form):
 
 class AddUser(forms.ModelForm):
     username = forms.CharField(label="Username", min_length=2, required=True,
-                               widget=forms.TextInput(attrs={"class": "form-group"}))
+                               widget=_FORM_GROUP_INPUT)
     email = forms.EmailField(label="Email", min_length=4, required=True,
-                             widget=forms.TextInput(attrs={"class": "form-group"}))
+                             widget=_FORM_GROUP_INPUT)
     first_name = forms.CharField(label="First Name", min_length=2, required=True,
-                                 widget=forms.TextInput(attrs={"class": "form-group"}))
+                                 widget=_FORM_GROUP_INPUT)
     last_name = forms.CharField(label="Last Name", min_length=2, required=True,
-                                widget=forms.TextInput(attrs={"class": "form-group"}))
+                                widget=_FORM_GROUP_INPUT)
     password = forms.CharField(label="Password", min_length=4, required=True,
-                               widget=forms.TextInput(attrs={"class": "form-group"}))
+                               widget=_FORM_GROUP_INPUT)
     user_role = forms.ChoiceField(label="User Role", choices=ROLE_CHOICES,
                                   widget=forms.RadioSelect, required=True)
 
@@ -56,17 +80,21 @@ class AddUser(forms.ModelForm):
 
 
 class UpdateUser(forms.ModelForm):
+    # The only User columns this form and update_user_view read; callers should
+    # load the instance with User.objects.only(*UpdateUser.instance_fields)
+    instance_fields = ("username", "first_name", "last_name", "is_superuser", "is_staff")
+
     username = forms.CharField(label="Username", min_length=2, required=True,
-                               widget=forms.TextInput(attrs={"class": "form-group"}))
+                               widget=_FORM_GROUP_INPUT)
     first_name = forms.CharField(label="First Name", min_length=2, required=True,
-                                 widget=forms.TextInput(attrs={"class": "form-group"}))
+                                 widget=_FORM_GROUP_INPUT)
     last_name = forms.CharField(label="Last Name", min_length=2, required=True,
-                                widget=forms.TextInput(attrs={"class": "form-group"}))
+                                widget=_FORM_GROUP_INPUT)
     password = forms.CharField(label="Password", required=False, min_length=4,
-                               widget=forms.TextInput(attrs={"class": "form-group"}))
+                               widget=_FORM_GROUP_INPUT)
     confirm_password = forms.CharField(label="Confirm Password", required=False,
                                        min_length=4,
-                                       widget=forms.TextInput(attrs={"class": "form-group"}))
+                                       widget=_FORM_GROUP_INPUT)
     user_role = forms.ChoiceField(label="User Role", choices=ROLE_CHOICES,
                                   widget=forms.RadioSelect, required=True)
 
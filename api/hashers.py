@@ -0,0 +1,17 @@
+"""
+Password hashers.
+
+Argon2id with parameters tuned for interactive CMS sign-in rather than
+Django's defaults (100 MiB, parallelism 8). Existing hashes with other
+parameters or from legacy hashers are upgraded on the user's next login.
+"""
+
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """Argon2id: 46 MiB memory, 2 passes, 1 lane (OWASP-recommended floor)."""
+
+    time_cost = 2
+    memory_cost = 46 * 1024  # KiB
+    parallelism = 1
@@ -4,18 +4,64 @@ Health check endpoint for monitoring system status.
 Checks database connectivity, cache availability, and overall system health.
 """
 
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.db import connection
 from django.core.cache import cache
-from django.utils import timezone
+from django_redis import get_redis_connection
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods
 from drf_spectacular.utils import extend_schema, inline_serializer
 from rest_framework import serializers
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone as dt_timezone
+import logging
+import threading
 import time
 
+logger = logging.getLogger(__name__)
+
+# Runs the cache probe alongside the database probe. The DB probe stays on the
+# request thread because Django database connections are per-thread.
+_PROBE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="health-probe")
+
+# Probe results are reused for this long so bursts of monitoring requests
+# collapse into one real round-trip. Keep well below the probe interval.
+_PROBE_TTL_SECONDS = 1.0
+_probe_results = {}  # probe name -> (monotonic time checked, result)
+_probe_locks = {"database": threading.Lock(), "cache": threading.Lock()}
+
+
+# Formatted "timestamp" for health responses, refreshed at most every 100 ms
+_TIMESTAMP_GRANULARITY_SECONDS = 0.1
+_last_timestamp = (0.0, "")  # (time.time() when formatted, ISO 8601 string)
+
+
+def _health_timestamp():
+    """Current UTC time in ISO 8601 (same format as timezone.now().isoformat())."""
+    global _last_timestamp
+    now = time.time()
+    if now - _last_timestamp[0] >= _TIMESTAMP_GRANULARITY_SECONDS:
+        _last_timestamp = (now, datetime.fromtimestamp(now, dt_timezone.utc).isoformat())
+    return _last_timestamp[1]
+
+
+def _cached_probe(name, probe):
+    """Return probe()'s result, re-running it at most once per _PROBE_TTL_SECONDS."""
+    entry = _probe_results.get(name)
+    if entry is not None and time.monotonic() - entry[0] < _PROBE_TTL_SECONDS:
+        return entry[1]
+    with _probe_locks[name]:
+        # Another thread may have refreshed it while we waited for the lock
+        entry = _probe_results.get(name)
+        if entry is not None and time.monotonic() - entry[0] < _PROBE_TTL_SECONDS:
+            return entry[1]
+        result = probe()
+        _probe_results[name] = (time.monotonic(), result)
+        return result
+
 
 @extend_schema(
     tags=['Monitoring'],
@@ -50,19 +96,23 @@ class HealthCheckView(APIView):
     def get(self, request):
         health_status = {
             'status': 'healthy',
-            'timestamp': timezone.now().isoformat(),
+            'timestamp': _health_timestamp(),
             'checks': {}
         }
         
+        # Probe cache (worker thread) and database (this thread) concurrently,
+        # so latency is max(db, cache) rather than the sum
+        cache_future = _PROBE_EXECUTOR.submit(_cached_probe, "cache", self._check_cache)
+
         # Check database connectivity
-        db_healthy = self._check_database()
+        db_healthy = _cached_probe("database", self._check_database)
         health_status['checks']['database'] = {
             'status': 'healthy' if db_healthy else 'unhealthy',
             'response_time_ms': None
         }
         
         # Check cache connectivity
-        cache_healthy, cache_time = self._check_cache()
+        cache_healthy, cache_time = cache_future.result()
         health_status['checks']['cache'] = {
             'status': 'healthy' if cache_healthy else 'unhealthy',
             'response_time_ms': cache_time
@@ -76,7 +126,13 @@ class HealthCheckView(APIView):
         return JsonResponse(health_status, status=200)
     
     def _check_database(self):
-        """Check if database is accessible."""
+        """
+        Check if database is accessible.
+
+        Deliberately synchronous: the views are sync DRF APIViews and Django has
+        no async cursor API, so under ASGI the whole view already runs in one
+        worker thread and this probe adds no extra thread-pool hop.
+        """
         try:
             start = time.time()
             with connection.cursor() as cursor:
@@ -84,20 +140,29 @@ class HealthCheckView(APIView):
                 cursor.fetchone()
             return True
         except Exception as e:
-            print(f"Database health check failed: {e}")
+            logger.warning("Database health check failed: %s", e)
             return False
     
     def _check_cache(self):
         """Check if cache (Redis) is accessible."""
         try:
             start = time.time()
-            cache.set('health_check', 'ok', 10)
-            result = cache.get('health_check')
+            try:
+                # SET + GET pipelined into a single Redis round-trip
+                pipe = get_redis_connection("default").pipeline()
+                pipe.set('health_check', 'ok', ex=10)
+                pipe.get('health_check')
+                _, value = pipe.execute()
+                result = value.decode() if value is not None else None
+            except NotImplementedError:
+                # Non-Redis cache backend (e.g. locmem in local settings)
+                cache.set('health_check', 'ok', 10)
+                result = cache.get('health_check')
             end = time.time()
             response_time = round((end - start) * 1000, 2)
             return result == 'ok', response_time
         except Exception as e:
-            print(f"Cache health check failed: {e}")
+            logger.warning("Cache health check failed: %s", e)
             return False, None
 
 
@@ -127,7 +192,7 @@ class ReadinessCheckView(APIView):
     
     def get(self, request):
         # Check critical components
-        db_ready = self._check_database()
+        db_ready = _cached_probe("database", self._check_database)
         
         if db_ready:
             return JsonResponse({
@@ -141,42 +206,35 @@ class ReadinessCheckView(APIView):
             }, status=503)
     
     def _check_database(self):
-        """Quick database check."""
+        """Quick database check: connect if needed, then a driver-level ping (no cursor/query)."""
         try:
-            with connection.cursor() as cursor:
-                cursor.execute("SELECT 1")
-            return True
-        except:
+            connection.ensure_connection()
+            if connection.is_usable():
+                return True
+            # A persistent connection (CONN_MAX_AGE) can outlive a MySQL restart or
+            # failover; ensure_connection() keeps the dead one, so drop it and retry once
+            connection.close()
+            connection.ensure_connection()
+            return connection.is_usable()
+        except Exception as e:
+            logger.warning("Database readiness check failed: %s", e)
             return False
 
 
-@extend_schema(
-    tags=['Monitoring'],
-    summary='Liveness check endpoint',
-    description='Check if the application process is alive. Always returns 200 if the process is running.',
-    auth=[],
-    responses={
-        200: inline_serializer(
-            name='LivenessCheckResponse',
-            fields={
-                'status': serializers.CharField(),
-                'alive': serializers.BooleanField(),
-            }
-        )
-    }
-)
-@method_decorator(csrf_exempt, name='dispatch')
-class LivenessCheckView(APIView):
+# Constant liveness body, serialized once at import
+_LIVE_BYTES = b'{"status": "alive", "alive": true}'
+
+
+# Liveness check: a plain Django view, no DRF request/permission/throttle machinery.
+# Not listed in the API schema (drf-spectacular only documents DRF views).
+# HEAD and OPTIONS stay allowed as with the old APIView; some load balancers
+# (e.g. HAProxy httpchk) probe with them.
+@csrf_exempt
+@require_http_methods(["GET", "HEAD", "OPTIONS"])
+def liveness_check(request):
     """
     Liveness check endpoint for Kubernetes.
-    
+
     Returns 200 as long as the process is running.
     """
-    permission_classes = [AllowAny]
-    
-    def get(self, request):
-        return JsonResponse({
-            'status': 'alive',
-            'alive': True
-        }, status=200)
-
+    return HttpResponse(_LIVE_BYTES, content_type="application/json")
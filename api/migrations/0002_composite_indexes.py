@@ -0,0 +1,41 @@
+# Generated by Django 4.2.16 on 2026-10-15 04:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='device',
+            name='devices_device__c4b5e4_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='user',
+            name='users_email_4b85f2_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='user',
+            name='users_is_acti_847b48_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='user',
+            name='users_is_staf_9ea57e_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='userprofile',
+            name='user_profil_email_8a1024_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='userprofile',
+            name='user_profil_is_veri_0e3ed5_idx',
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['is_staff', 'is_active'], name='users_is_staf_b59a17_idx'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Server-side defaults for created_at/updated_at on MySQL.
+#
+# The ORM keeps auto_now_add/auto_now (Django 4.2 has no db_default), so this
+# only matters for rows inserted outside the ORM (LOAD DATA, raw bulk INSERTs),
+# which can now omit the timestamp columns. UTC_TIMESTAMP matches how Django
+# stores datetimes with USE_TZ=True. Expression defaults need MySQL 8.0.13+.
+#
+# Django's migration state does not know about these defaults: a later AlterField
+# on any of these columns emits MODIFY COLUMN and drops them, so such a migration
+# must call set_db_defaults() again. On Django 5+, db_default=Now() on the model
+# fields replaces this migration.
+
+from django.db import migrations
+
+
+TABLES = ["user_profiles", "devices"]
+COLUMNS = ["created_at", "updated_at"]
+
+
+def set_db_defaults(apps, schema_editor):
+    if schema_editor.connection.vendor != "mysql":
+        return
+    for table in TABLES:
+        for column in COLUMNS:
+            schema_editor.execute(
+                f"ALTER TABLE `{table}` ALTER COLUMN `{column}` SET DEFAULT (UTC_TIMESTAMP(6))"
+            )
+
+
+def drop_db_defaults(apps, schema_editor):
+    if schema_editor.connection.vendor != "mysql":
+        return
+    for table in TABLES:
+        for column in COLUMNS:
+            schema_editor.execute(f"ALTER TABLE `{table}` ALTER COLUMN `{column}` DROP DEFAULT")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(set_db_defaults, drop_db_defaults),
+    ]
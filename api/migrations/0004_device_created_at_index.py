@@ -0,0 +1,17 @@
+# Generated by Django 4.2.16 on 2026-10-15 04:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_timestamp_db_defaults'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='device',
+            index=models.Index(fields=['created_at'], name='devices_created_ac5a25_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.16 on 2026-10-15 04:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_device_created_at_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['deleted_at'], name='users_deleted_e48316_idx'),
+        ),
+    ]
@@ -39,10 +39,11 @@ class User(AbstractUser):
         db_table = "users"
         verbose_name = _("user")
         verbose_name_plural = _("users")
+        # username and email are covered by their unique constraints
         indexes = [
-            models.Index(fields=["email"]),
-            models.Index(fields=["is_active"]),
-            models.Index(fields=["is_staff"]),
+            models.Index(fields=["is_staff", "is_active"]),
+            # Active-user count (deleted_at IS NULL) becomes an index-only range scan
+            models.Index(fields=["deleted_at"]),
         ]
 
     def __str__(self):
@@ -60,18 +61,24 @@ class UserProfile(models.Model):
     bio = models.TextField(blank=True, null=True)
     is_verified = models.BooleanField(default=False, db_index=True)
 
-    # Extensible metadata — store any extra per-profile data here
+    # Extensible metadata — store any extra per-profile data here.
+    # Not indexed: MySQL cannot index a JSON column directly. If you start
+    # filtering on a key (metadata__plan=...), add a functional index on that
+    # key in Meta.indexes, e.g.
+    #   models.Index(Cast(KT("metadata__plan"), models.CharField(max_length=50)), name="up_meta_plan_idx")
+    # (KT from django.db.models.fields.json, Cast from django.db.models.functions)
     metadata = models.JSONField(default=dict, blank=True)
 
+    # On MySQL these columns also carry DEFAULT (UTC_TIMESTAMP(6)), added by raw SQL in
+    # migration 0003 and unknown to Django's migration state. Any AlterField on them
+    # emits MODIFY COLUMN, which silently drops that default: re-run 0003's
+    # set_db_defaults in the same migration. On Django 5+, replace with db_default=Now().
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = "user_profiles"
-        indexes = [
-            models.Index(fields=["email"]),
-            models.Index(fields=["is_verified"]),
-        ]
+        # email and is_verified are indexed via db_index=True on the fields
 
     def __str__(self):
         return self.email or self.name or str(self.id)
@@ -94,14 +101,17 @@ class Device(models.Model):
         db_index=True,
     )
 
+    # Raw-SQL MySQL default from migration 0003; see the note on UserProfile.created_at
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = "devices"
+        # device_id is covered by its unique constraint
         indexes = [
-            models.Index(fields=["device_id"]),
             models.Index(fields=["profile"]),
+            # Range scans for the dashboard registration trend
+            models.Index(fields=["created_at"]),
         ]
 
     def __str__(self):
@@ -0,0 +1,22 @@
+"""
+Custom DRF parsers.
+
+OrjsonParser is a drop-in replacement for rest_framework.parsers.JSONParser
+backed by orjson, used on hot, small-payload endpoints such as auth.
+"""
+
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class OrjsonParser(BaseParser):
+    """Parse application/json request bodies with orjson."""
+
+    media_type = "application/json"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
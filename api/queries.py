@@ -0,0 +1,112 @@
+"""
+Shared ORM lookups for CMS views.
+
+Each helper loads exactly what its caller renders or writes, so views don't
+pull full User rows (password hash, profile columns) they never touch.
+The dashboard aggregation lives here too, so the signal handlers and the
+dashboard cron job can use it without importing the views.
+"""
+
+from datetime import datetime, time, timedelta
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+
+from .forms import UpdateUser
+from .models import Device, User
+
+
+def get_user_for_edit(pk):
+    """
+    User for the update form, limited to UpdateUser.instance_fields.
+
+    The form and user/update_user.html use no relations (groups, permissions),
+    so there is nothing to prefetch; saving the instance only writes loaded fields.
+    """
+    return get_object_or_404(User.objects.only(*UpdateUser.instance_fields), pk=pk)
+
+
+def approx_row_count(model):
+    """
+    InnoDB's estimated row count for `model`'s table, or None when not on MySQL.
+
+    Read from information_schema instead of scanning the table, so it can be off
+    by tens of percent and, on MySQL 8, lag by information_schema_stats_expiry.
+    """
+    if connection.vendor != "mysql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT TABLE_ROWS FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+            [model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    return row[0] if row else None
+
+
+# Serialized device payloads, cached by the device registration API for repeat
+# registrations (app relaunches). Defined here rather than in the view module so
+# api/signals.py can invalidate them without importing DRF views.
+# Invalidated by the Device/UserProfile signal handlers in api/signals.py.
+DEVICE_CACHE_KEY = "device:{}"
+DEVICE_CACHE_TTL = 60 * 60  # 1 hour
+
+
+# Aggregated dashboard stats, keyed by date so the chart window rolls over at midnight.
+# Invalidated by the User/Device signal handlers in api/signals.py.
+DASHBOARD_CACHE_KEY = "dashboard:stats:{}"
+
+
+def dashboard_cache_key(day=None):
+    """Cache key for the dashboard stats of `day` (default: today)."""
+    return DASHBOARD_CACHE_KEY.format((day or timezone.localdate()).isoformat())
+
+
+# Chart days and their "YYYY-MM-DD" labels for the 15-day window ending `today`;
+# maxsize=2 keeps the previous day around across the midnight rollover
+@lru_cache(maxsize=2)
+def _chart_days_for(today):
+    days = tuple(today - timedelta(days=i) for i in reversed(range(15)))
+    return days, tuple(d.strftime("%Y-%m-%d") for d in days)
+
+
+def compute_dashboard_stats(today):
+    """Run the dashboard queries: user/device totals and the 15-day device trend."""
+    total_users = User.objects.filter(deleted_at__isnull=True).count()
+    # Device has no filter, so the table estimate can stand in for COUNT(*) when enabled
+    total_devices = approx_row_count(Device) if settings.DASHBOARD_APPROX_COUNTS else None
+    if total_devices is None:
+        total_devices = Device.objects.count()
+
+    # 15-day device registration trend (for the chart)
+    # Filter on an aware datetime bound (not created_at__date) so the created_at index is usable
+    tz = timezone.get_current_timezone()
+    fifteen_days_ago = today - timedelta(days=14)
+    start_dt = timezone.make_aware(datetime.combine(fifteen_days_ago, time.min), tz)
+    # (day, count) tuples straight into a dict; no ORDER BY since the labels fix the order
+    device_trend_qs = (
+        Device.objects.filter(created_at__gte=start_dt)
+        .annotate(day=TruncDate("created_at", tzinfo=tz))
+        .values("day")
+        .annotate(count=Count("id"))
+        .values_list("day", "count")
+        .order_by()
+    )
+    date_map = dict(device_trend_qs)
+    days, labels = _chart_days_for(today)
+    # Lists, not tuples: home.html renders these directly as JS array literals
+    chart_labels = list(labels)
+    chart_counts = [date_map.get(d, 0) for d in days]
+
+    return {
+        "total_users": total_users,
+        "total_devices": total_devices,
+        "chart_labels": chart_labels,
+        "device_counts": chart_counts,
+    }
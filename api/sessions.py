@@ -0,0 +1,57 @@
+"""
+CMS session backend.
+
+Django's cached_db store calls the cache without error handling, so a Redis
+outage turns every sign-in and session read into a 500. This store treats
+cache errors as misses and skipped writes; the database stays the source of
+truth, as it already is for cached_db.
+Enabled via SESSION_ENGINE = "api.sessions" in core/settings.py.
+"""
+
+import logging
+
+from django.contrib.sessions.backends import cached_db
+
+logger = logging.getLogger(__name__)
+
+
+class _FailSoftCache:
+    """Wraps the session cache so Redis errors read as misses and writes are skipped."""
+
+    def __init__(self, cache):
+        self._cache = cache
+
+    # Session keys are credentials, so they are left out of the log messages
+    def get(self, key, *args, **kwargs):
+        try:
+            return self._cache.get(key, *args, **kwargs)
+        except Exception as e:
+            logger.warning("[Redis] session cache get error: %s", e)
+            return None
+
+    def set(self, key, *args, **kwargs):
+        try:
+            self._cache.set(key, *args, **kwargs)
+        except Exception as e:
+            logger.warning("[Redis] session cache set error: %s", e)
+
+    def delete(self, key):
+        try:
+            self._cache.delete(key)
+        except Exception as e:
+            logger.warning("[Redis] session cache delete error: %s", e)
+
+    def __contains__(self, key):
+        try:
+            return key in self._cache
+        except Exception as e:
+            logger.warning("[Redis] session cache lookup error: %s", e)
+            return False
+
+
+class SessionStore(cached_db.SessionStore):
+    """cached_db sessions that fall back to the database when the cache is unavailable."""
+
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        self._cache = _FailSoftCache(self._cache)
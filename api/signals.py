@@ -0,0 +1,46 @@
+"""
+Model signal handlers.
+
+Keeps cached API payloads in sync with the models they were built from.
+"""
+
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Device, User, UserProfile
+from .utils import delete_cache
+from .queries import DEVICE_CACHE_KEY, dashboard_cache_key
+
+
+@receiver([post_save, post_delete], sender=Device)
+def invalidate_device_cache(sender, instance, created=False, **kwargs):
+    """Drop the cached registration payload when a device changes."""
+    if created:
+        return
+    delete_cache(DEVICE_CACHE_KEY.format(instance.device_id))
+
+
+@receiver(post_save, sender=UserProfile)
+def invalidate_profile_devices_cache(sender, instance, created=False, **kwargs):
+    """The registration payload embeds the profile, so drop it for every device of the profile."""
+    if created:
+        return
+    for device_id in instance.devices.values_list("device_id", flat=True):
+        delete_cache(DEVICE_CACHE_KEY.format(device_id))
+
+
+@receiver([post_save, post_delete], sender=Device)
+def invalidate_dashboard_on_device_change(sender, instance, created=True, **kwargs):
+    """Device totals and the trend only change when devices are added or removed."""
+    # post_delete sends no `created`, so the default covers deletions
+    if not created:
+        return
+    delete_cache(dashboard_cache_key())
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_dashboard_on_user_change(sender, instance, update_fields=None, **kwargs):
+    """The user total counts non-deleted users; skip partial saves such as last_login updates."""
+    if update_fields is not None and "deleted_at" not in update_fields:
+        return
+    delete_cache(dashboard_cache_key())
@@ -0,0 +1,239 @@
+from unittest import mock, skipUnless
+
+import time
+
+import jwt
+from django.conf import settings
+from django.http import HttpResponse
+from django.contrib.messages import get_messages
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from .apis.auth import decorator, helpers
+from .apis.auth.decorator import jwt_required
+from .apis.auth.helpers import encode_jwt, is_base64, issue_tokens_atomic, is_refresh_token_valid
+from .health import ReadinessCheckView
+from .models import User
+
+try:
+    import fakeredis
+except ImportError:  # test-only dependency
+    fakeredis = None
+
+
+@override_settings(JWT_ALGORITHM="HS256")
+class EncodeJwtTests(SimpleTestCase):
+    payload = {"iat": 1735689600, "exp": 1735693200, "device_id": "device-1234", "type": "access"}
+
+    def test_matches_pyjwt_byte_for_byte(self):
+        self.assertEqual(encode_jwt(self.payload), jwt.encode(self.payload, settings.JWT_SECRET, algorithm="HS256"))
+
+    def test_round_trips_through_decode(self):
+        decoded = jwt.decode(
+            encode_jwt(self.payload), settings.JWT_SECRET, algorithms=["HS256"], options={"verify_exp": False}
+        )
+        self.assertEqual(decoded, self.payload)
+
+
+class IsBase64Tests(SimpleTestCase):
+    def test_accepts_valid_padding(self):
+        for value in ("QUJD", "QUI=", "QQ==", "+cCJfeRtg05l0sxiV3PdMJmxuk4Woy6X462PSZ9najk="):
+            with self.subTest(value=value):
+                self.assertTrue(is_base64(value))
+
+    def test_rejects_malformed(self):
+        for value in ("QUJ", "QQ=", "Q===", "QUJD====", "QQ=A", "Q=QA", "QUJ-", "QUJ_", "QUJé"):
+            with self.subTest(value=value):
+                self.assertFalse(is_base64(value))
+
+
+@skipUnless(fakeredis, "fakeredis is not installed")
+class IssueTokensAtomicTests(SimpleTestCase):
+    def setUp(self):
+        self.redis = fakeredis.FakeRedis()
+        patcher = mock.patch.object(helpers, "get_redis_connection", return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_replayed_nonce_stores_no_refresh_key(self):
+        self.redis.set(helpers._nonce_key("nonce-0001"), "device:other")
+        self.assertFalse(issue_tokens_atomic("device-1234", "nonce-0001", "jti-1"))
+        self.assertFalse(self.redis.exists(helpers._refresh_key("device-1234")))
+
+    def test_replay_keeps_current_refresh_token(self):
+        self.assertTrue(issue_tokens_atomic("device-1234", "nonce-0001", "jti-1"))
+        self.assertFalse(issue_tokens_atomic("device-1234", "nonce-0001", "jti-2"))
+        self.assertTrue(is_refresh_token_valid("device-1234", "jti-1"))
+        self.assertFalse(is_refresh_token_valid("device-1234", "jti-2"))
+
+    def test_new_pair_supersedes_previous_refresh_token(self):
+        self.assertTrue(issue_tokens_atomic("device-1234", "nonce-0001", "jti-1"))
+        self.assertTrue(issue_tokens_atomic("device-1234", "nonce-0002", "jti-2"))
+        self.assertFalse(is_refresh_token_valid("device-1234", "jti-1"))
+        self.assertTrue(is_refresh_token_valid("device-1234", "jti-2"))
+
+
+class ReadinessCheckTests(SimpleTestCase):
+    def test_reconnects_after_dead_persistent_connection(self):
+        with mock.patch("api.health.connection") as conn:
+            conn.is_usable.side_effect = [False, True]
+            self.assertTrue(ReadinessCheckView()._check_database())
+        conn.close.assert_called_once_with()
+        self.assertEqual(conn.ensure_connection.call_count, 2)
+
+    def test_not_ready_when_reconnect_fails(self):
+        with mock.patch("api.health.connection") as conn:
+            conn.is_usable.return_value = False
+            self.assertFalse(ReadinessCheckView()._check_database())
+
+
+@jwt_required
+def _protected_view(request):
+    return HttpResponse("ok")
+
+
+class JwtRequiredTests(SimpleTestCase):
+    def setUp(self):
+        decorator._decode_token.cache_clear()
+        self.factory = RequestFactory()
+
+    def _call(self, token):
+        return _protected_view(self.factory.get("/", HTTP_AUTHORIZATION=f"Bearer {token}"))
+
+    def _token(self, ttl=60):
+        now = int(time.time())
+        payload = {"iat": now, "exp": now + ttl, "device_id": "device-1234", "type": "access"}
+        return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+
+    def test_valid_token_passes(self):
+        self.assertEqual(self._call(self._token()).status_code, 200)
+
+    def test_cached_token_rejected_once_expired(self):
+        token = self._token(ttl=60)
+        self.assertEqual(self._call(token).status_code, 200)
+        with mock.patch.object(decorator.time, "time", return_value=time.time() + 120):
+            response = self._call(token)
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(decorator._decode_token.cache_info().hits, 1)
+
+    def test_malformed_token_rejected(self):
+        for token in ("garbage", self._token() + "x", jwt.encode({"iat": 0}, settings.JWT_SECRET, algorithm="HS256")):
+            with self.subTest(token=token):
+                self.assertEqual(self._call(token).status_code, 401)
+
+    def test_oversized_token_rejected_without_decoding(self):
+        self.assertEqual(self._call("a" * (decorator._MAX_TOKEN_LENGTH + 1)).status_code, 401)
+        self.assertEqual(decorator._decode_token.cache_info().misses, 0)
+
+    def test_missing_bearer_header_rejected(self):
+        for header in ("", "Token abc", "Bearer"):
+            with self.subTest(header=header):
+                response = _protected_view(self.factory.get("/", HTTP_AUTHORIZATION=header))
+                self.assertEqual(response.status_code, 401)
+
+
+# CMS view tests run against a local cache and a fast hasher; neither is under test here
+_CMS_TEST_SETTINGS = {
+    "CACHES": {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    "PASSWORD_HASHERS": ["django.contrib.auth.hashers.MD5PasswordHasher"],
+}
+
+
+def _messages(response):
+    return [str(m) for m in get_messages(response.wsgi_request)]
+
+
+@override_settings(**_CMS_TEST_SETTINGS)
+class CmsRoleGateTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = User.objects.create_user("root", "root@example.com", "pass1234", is_staff=True, is_superuser=True)
+        cls.staff = User.objects.create_user("staff", "staff@example.com", "pass1234", is_staff=True)
+        cls.plain = User.objects.create_user("plain", "plain@example.com", "pass1234")
+        cls.target = User.objects.create_user("target", "target@example.com", "pass1234", is_staff=True)
+
+    def _get(self, user, name, *args):
+        self.client.force_login(user)
+        return self.client.get(reverse(name, args=args))
+
+    def test_superuser_can_delete(self):
+        response = self._get(self.superuser, "deleteUser", self.target.pk)
+        self.assertRedirects(response, reverse("userList"), fetch_redirect_response=False)
+        self.target.refresh_from_db()
+        self.assertIsNotNone(self.target.deleted_at)
+
+    def test_staff_cannot_delete(self):
+        response = self._get(self.staff, "deleteUser", self.target.pk)
+        self.assertRedirects(response, reverse("userList"), fetch_redirect_response=False)
+        self.target.refresh_from_db()
+        self.assertIsNone(self.target.deleted_at)
+
+    def test_staff_can_restore(self):
+        User.objects.filter(pk=self.target.pk).update(deleted_at=timezone.now())
+        response = self._get(self.staff, "restoreUser", self.target.pk)
+        self.assertRedirects(response, reverse("userList"), fetch_redirect_response=False)
+        self.target.refresh_from_db()
+        self.assertIsNone(self.target.deleted_at)
+
+    def test_non_staff_cannot_restore(self):
+        User.objects.filter(pk=self.target.pk).update(deleted_at=timezone.now())
+        self._get(self.plain, "restoreUser", self.target.pk)
+        self.target.refresh_from_db()
+        self.assertIsNotNone(self.target.deleted_at)
+
+    def test_superuser_can_add(self):
+        self.assertEqual(self._get(self.superuser, "addUser").status_code, 200)
+        response = self.client.post(reverse("addUser"), {
+            "username": "carol", "email": "carol@example.com", "first_name": "Carol",
+            "last_name": "Cee", "password": "pass1234", "user_role": "staff",
+        })
+        self.assertRedirects(response, reverse("userList"), fetch_redirect_response=False)
+        carol = User.objects.get(username="carol")
+        self.assertTrue(carol.is_staff)
+        self.assertTrue(carol.check_password("pass1234"))
+
+    def test_non_superusers_cannot_add(self):
+        for user in (self.staff, self.plain):
+            with self.subTest(user=user.username):
+                response = self._get(user, "addUser")
+                self.assertRedirects(response, reverse("userList"), fetch_redirect_response=False)
+                self.assertIn("Unauthorized access (Only SuperUser can add a user)", _messages(response))
+
+
+@override_settings(**_CMS_TEST_SETTINGS)
+class SigninViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create_user("staff", "staff@example.com", "pass1234", is_staff=True)
+        cls.ghost = User.objects.create_user(
+            "ghost", "ghost@example.com", "pass1234", is_staff=True, deleted_at=timezone.now()
+        )
+
+    def _sign_in(self, username, password):
+        return self.client.post(reverse("sign_in"), {"username": username, "password": password})
+
+    def test_valid_credentials_log_in(self):
+        response = self._sign_in("staff", "pass1234")
+        self.assertRedirects(response, reverse("dashboard"), fetch_redirect_response=False)
+        self.assertEqual(int(self.client.session["_auth_user_id"]), self.staff.pk)
+
+    def test_wrong_password_rejected(self):
+        response = self._sign_in("staff", "wrong-pass")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Incorrect username or password", _messages(response))
+        self.assertNotIn("_auth_user_id", self.client.session)
+
+    def test_unknown_user_rejected(self):
+        response = self._sign_in("nobody", "pass1234")
+        self.assertIn("Incorrect username or password", _messages(response))
+        self.assertNotIn("_auth_user_id", self.client.session)
+
+    def test_soft_deleted_user_rejected(self):
+        for skip_equalization in (False, True):
+            with self.subTest(SKIP_TIMING_EQUALIZATION=skip_equalization):
+                with override_settings(SKIP_TIMING_EQUALIZATION=skip_equalization):
+                    response = self._sign_in("ghost", "pass1234")
+                self.assertEqual(response.status_code, 200)
+                self.assertIn("Invalid user", _messages(response))
+                self.assertNotIn("_auth_user_id", self.client.session)
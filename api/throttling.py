@@ -7,16 +7,16 @@ to prevent abuse and ensure fair usage.
 All throttles use IP-based rate limiting for consistent tracking.
 """
 
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework.throttling import AnonRateThrottle, SimpleRateThrottle
 
 
-class AuthTokenRateThrottle(SimpleRateThrottle):
+class IPScopedThrottle(SimpleRateThrottle):
     """
-    Strict rate limiting for authentication token endpoint.
-    5 requests per minute per IP to prevent brute force attacks.
+    Base for the scoped throttles below: keyed by scope + client IP,
+    for authenticated and anonymous requests alike. Subclasses set `scope`.
     """
-    scope = 'auth_token'
-    
+
     def get_cache_key(self, request, view):
         # IP-based throttling only
         return self.cache_format % {
@@ -25,6 +25,14 @@ class AuthTokenRateThrottle(SimpleRateThrottle):
         }
 
 
+class AuthTokenRateThrottle(IPScopedThrottle):
+    """
+    Strict rate limiting for authentication token endpoint.
+    5 requests per minute per IP to prevent brute force attacks.
+    """
+    scope = 'auth_token'
+
+
 class BurstRateThrottle(AnonRateThrottle):
     """
     Burst rate limiting for general API endpoints.
@@ -43,63 +51,51 @@ class SustainedRateThrottle(AnonRateThrottle):
     scope = 'sustained'
 
 
-class DataModificationRateThrottle(SimpleRateThrottle):
+class DataModificationRateThrottle(IPScopedThrottle):
     """
     Rate limiting for data modification operations (POST/PUT/PATCH).
     30 requests per minute per IP to prevent spam and abuse.
     """
     scope = 'data_modification'
-    
-    def get_cache_key(self, request, view):
-        # IP-based throttling only
-        return self.cache_format % {
-            'scope': self.scope,
-            'ident': self.get_ident(request)
-        }
 
 
-class ContentListingRateThrottle(SimpleRateThrottle):
+class ContentListingRateThrottle(IPScopedThrottle):
     """
     Rate limiting for content listing and discovery endpoints.
     30 requests per minute per IP to prevent scraping.
     Used for: home feeds, shorts, trainer listings, playlist listings, etc.
     """
     scope = 'content_listing'
-    
-    def get_cache_key(self, request, view):
-        # IP-based throttling only
-        return self.cache_format % {
-            'scope': self.scope,
-            'ident': self.get_ident(request)
-        }
 
 
-class SearchRateThrottle(SimpleRateThrottle):
+class SearchRateThrottle(IPScopedThrottle):
     """
     Rate limiting for search query endpoints.
     20 requests per minute per IP to prevent abuse and scraping.
     Stricter than content listing due to expensive search operations.
     """
     scope = 'search'
-    
-    def get_cache_key(self, request, view):
-        # IP-based throttling only
-        return self.cache_format % {
-            'scope': self.scope,
-            'ident': self.get_ident(request)
-        }
 
 
-class AdminActionRateThrottle(SimpleRateThrottle):
+class AdminActionRateThrottle(IPScopedThrottle):
     """
     Rate limiting for admin actions.
     100 requests per hour per IP for admin operations.
     """
     scope = 'admin'
-    
-    def get_cache_key(self, request, view):
-        # IP-based throttling only
-        return self.cache_format % {
-            'scope': self.scope,
-            'ident': self.get_ident(request)
-        }
+
+
+class ReadWriteThrottleMixin:
+    """
+    Splits an APIView's throttling by method: safe methods (GET/HEAD/OPTIONS)
+    use `read_throttle_classes`, all others `write_throttle_classes`.
+    This replaces throttle_classes, so the DEFAULT_THROTTLE_CLASSES
+    (BurstRateThrottle/SustainedRateThrottle) do not apply to these views.
+    """
+    read_throttle_classes = [ContentListingRateThrottle]
+    write_throttle_classes = [DataModificationRateThrottle]
+
+    def get_throttles(self):
+        if self.request.method in SAFE_METHODS:
+            return [throttle() for throttle in self.read_throttle_classes]
+        return [throttle() for throttle in self.write_throttle_classes]
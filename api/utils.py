@@ -4,12 +4,18 @@ Shared utility functions.
 Provides consistent JSON response helpers, Redis cache wrappers,
 and pagination utilities used across all API views.
 """
+import logging
 import os
+import orjson
 from django.core.cache import cache
 from django.conf import settings
-from django.http import JsonResponse
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+from django_redis import get_redis_connection
 
 
+logger = logging.getLogger(__name__)
+
 CACHE_TTL = getattr(settings, "CACHE_TTL", 300)  # Default 5 minutes
 
 
@@ -25,11 +31,13 @@ def pagination_params(request) -> tuple:
         (page, page_size) tuple on success.
         Raises ValueError if params are invalid.
     """
-    try:
-        page = int(request.GET.get("page", 1))
-        page_size = int(request.GET.get("page_size", 10))
-    except (ValueError, TypeError):
+    params = request.GET
+    page = params.get("page", "1")
+    page_size = params.get("page_size", "10")
+    # isdecimal() accepts exactly the digit strings int() parses, so no try/except needed
+    if not (page.isdecimal() and page_size.isdecimal()):
         raise ValueError("page and page_size must be integers")
+    page, page_size = int(page), int(page_size)
 
     if page < 1:
         raise ValueError("page must be >= 1")
@@ -59,8 +67,8 @@ def paginated_response(items: list, *, total: int, page: int, page_size: int) ->
         data = MySerializer(qs[(page-1)*page_size : page*page_size], many=True).data
         return success_response("OK", data=paginated_response(data, total=total, page=page, page_size=page_size))
     """
-    import math
-    total_pages = math.ceil(total / page_size) if page_size > 0 else 1
+    # Integer ceiling division (no float round-trip)
+    total_pages = -(-total // page_size) if page_size > 0 else 1
     return {
         "pagination": {
             "current_page": page,
@@ -78,7 +86,27 @@ def paginated_response(items: list, *, total: int, page: int, page_size: int) ->
 # JSON Response helpers
 # ---------------------------------------------------------------------------
 
-def success_response(message: str, data=None, status: int = 200) -> JsonResponse:
+# Datetimes are passed through to DjangoJSONEncoder so their format matches JsonResponse
+_JSON_DEFAULT = DjangoJSONEncoder().default
+_JSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+def json_dumps(data) -> bytes:
+    """
+    Serialize data to JSON bytes with orjson.
+
+    Types orjson does not handle natively (datetime, Decimal, lazy strings, ...)
+    fall back to DjangoJSONEncoder, so output matches JsonResponse.
+    """
+    return orjson.dumps(data, default=_JSON_DEFAULT, option=_JSON_OPTIONS)
+
+
+def json_response(data, status: int = 200) -> HttpResponse:
+    """JSON response serialized with orjson; faster drop-in for JsonResponse."""
+    return HttpResponse(json_dumps(data), status=status, content_type="application/json")
+
+
+def success_response(message: str, data=None, status: int = 200) -> HttpResponse:
     """
     Standard success response.
 
@@ -88,10 +116,10 @@ def success_response(message: str, data=None, status: int = 200) -> JsonResponse
     response = {"success": True, "message": message}
     if data is not None:
         response["data"] = data
-    return JsonResponse(response, status=status)
+    return json_response(response, status=status)
 
 
-def error_response(message: str, status: int = 400, errors=None) -> JsonResponse:
+def error_response(message: str, status: int = 400, errors=None) -> HttpResponse:
     """
     Standard error response.
 
@@ -101,20 +129,23 @@ def error_response(message: str, status: int = 400, errors=None) -> JsonResponse
     response = {"success": False, "message": message}
     if errors is not None:
         response["errors"] = errors
-    return JsonResponse(response, status=status)
+    return json_response(response, status=status)
 
 
 # ---------------------------------------------------------------------------
 # Redis cache helpers
 # ---------------------------------------------------------------------------
 
-def set_cache(key: str, data, timeout: int = None) -> bool:
-    """Store data in Redis cache. Returns True on success, False on error."""
+def set_cache(key: str, data, timeout: int = CACHE_TTL) -> bool:
+    """
+    Store data in Redis cache (timeout=None stores without expiry).
+    Returns True on success, False on error.
+    """
     try:
-        cache.set(key, data, timeout=timeout if timeout is not None else CACHE_TTL)
+        cache.set(key, data, timeout=timeout)
         return True
     except Exception as e:
-        print(f"[Redis] set_cache error for key={key}: {e}")
+        logger.warning("[Redis] set_cache error for key=%s: %s", key, e)
         return False
 
 
@@ -123,7 +154,7 @@ def get_cache(key: str):
     try:
         return cache.get(key)
     except Exception as e:
-        print(f"[Redis] get_cache error for key={key}: {e}")
+        logger.warning("[Redis] get_cache error for key=%s: %s", key, e)
         return None
 
 
@@ -133,5 +164,29 @@ def delete_cache(key: str) -> bool:
         cache.delete(key)
         return True
     except Exception as e:
-        print(f"[Redis] delete_cache error for key={key}: {e}")
+        logger.warning("[Redis] delete_cache error for key=%s: %s", key, e)
         return False
+
+
+def set_raw_cache(key: str, value: bytes, timeout: int = CACHE_TTL) -> bool:
+    """
+    Store raw bytes in Redis, bypassing the Django cache layer (no pickling).
+    Use for pre-serialized payloads such as JSON response bodies.
+    timeout=None stores without expiry.
+    Returns True on success, False on error.
+    """
+    try:
+        get_redis_connection("default").set(key, value, ex=timeout)
+        return True
+    except Exception as e:
+        logger.warning("[Redis] set_raw_cache error for key=%s: %s", key, e)
+        return False
+
+
+def get_raw_cache(key: str):
+    """Retrieve raw bytes stored with set_raw_cache(). Returns None on miss or error."""
+    try:
+        return get_redis_connection("default").get(key)
+    except Exception as e:
+        logger.warning("[Redis] get_raw_cache error for key=%s: %s", key, e)
+        return None
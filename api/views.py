@@ -1,58 +1,91 @@
 # Standard library imports
-from datetime import datetime, timedelta
+import logging
+from functools import lru_cache, wraps
 
 # Third-party imports
+from django.conf import settings
 from django.contrib import messages
-from django.contrib.auth import authenticate, login, logout
+from django.contrib.auth import login, logout
 from django.contrib.auth.decorators import login_required
-from django.shortcuts import redirect, render
-from django.db.models import Count
-from django.db.models.functions import TruncDate
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.http import Http404, HttpResponseRedirect
+from django.shortcuts import render
+from django.urls import reverse
+from django.db import DatabaseError
+from django.forms import model_to_dict
 from django.utils import timezone
-from rest_framework.generics import get_object_or_404
 
 # Local imports
 from .forms import AddUser, UpdateUser, UserSigninForm
-from .models import User, Device
+from .models import User
+from .queries import compute_dashboard_stats, dashboard_cache_key, get_user_for_edit
+from .utils import delete_cache, get_cache, set_cache
 
 # TODO: Import your project-specific models and forms here, e.g.:
 # from .models import Category, Item
 # from .forms import AddCategoryForm, AddItemForm
+# from django.shortcuts import get_object_or_404
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# CMS access helpers
+# ---------------------------------------------------------------------------
+
+# Redirect targets are reversed once per process; redirect("name") walks the resolver every call
+@lru_cache(maxsize=None)
+def _url(name):
+    return reverse(name)
+
+
+# Runs the view only if test(request.user) passes; otherwise flashes `message`
+# (if given) and redirects to the user list. Apply below @login_required.
+def cms_role_required(test, message=None):
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if not test(request.user):
+                if message:
+                    messages.error(request, message)
+                return HttpResponseRedirect(_url("userList"))
+            return view_func(request, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _is_staff(user):
+    return user.is_staff
+
+
+def _is_staff_superuser(user):
+    return user.is_staff and user.is_superuser
+
+
+def _is_superuser(user):
+    return user.is_superuser
 
 
 # ---------------------------------------------------------------------------
 # CMS Dashboard
 # ---------------------------------------------------------------------------
 
-@login_required(login_url="/sign_in")
+@login_required
 def dashboard_view(request):
     """
     Render the CMS home dashboard with basic statistics.
     TODO: Add your project-specific stats to the context.
     """
-    total_users = User.objects.filter(deleted_at__isnull=True).count()
-    total_devices = Device.objects.count()
-
-    # 15-day device registration trend (for the chart)
-    today = timezone.now().date()
-    fifteen_days_ago = today - timedelta(days=14)
-    device_trend_qs = (
-        Device.objects.filter(created_at__date__gte=fifteen_days_ago)
-        .annotate(day=TruncDate("created_at"))
-        .values("day")
-        .annotate(count=Count("id"))
-        .order_by("day")
-    )
-    date_map = {entry["day"]: entry["count"] for entry in device_trend_qs}
-    labels = [(today - timedelta(days=i)) for i in reversed(range(15))]
-    chart_labels = [d.strftime("%Y-%m-%d") for d in labels]
-    chart_counts = [date_map.get(d, 0) for d in labels]
+    today = timezone.localdate()
+    cache_key = dashboard_cache_key(today)
+    stats = get_cache(cache_key)
+    if stats is None:
+        stats = compute_dashboard_stats(today)
+        set_cache(cache_key, stats, settings.DASHBOARD_CACHE_TTL)
 
     context = {
-        "total_users": total_users,
-        "total_devices": total_devices,
-        "chart_labels": chart_labels,
-        "device_counts": chart_counts,
+        **stats,
         # TODO: Add your project-specific stats here, e.g.:
         # "total_items": Item.objects.filter(is_active=True).count(),
     }
@@ -63,6 +96,13 @@ def dashboard_view(request):
 # CMS Authentication
 # ---------------------------------------------------------------------------
 
+# Single render path for the sign-in page; an unbound form is only built when none is passed
+def _render_signin(request, form=None):
+    if form is None:
+        form = UserSigninForm()
+    return render(request, "user/new_signin.html", {"form": form})
+
+
 def signin_view(request):
     """Handle admin/staff sign-in."""
     if (
@@ -70,128 +110,125 @@ def signin_view(request):
         and request.user.is_authenticated
         and (request.user.is_superuser or request.user.is_staff)
     ):
-        return redirect("dashboard")
-
-    if request.method == "POST":
-        form = UserSigninForm(request.POST)
-        try:
-            if form.is_valid():
-                username = form.cleaned_data.get("username")
-                password = form.cleaned_data.get("password")
-                user = authenticate(username=username, password=password)
-
-                if user is not None:
-                    if user.deleted_at is not None:
-                        messages.error(request, "Invalid user")
-                        return render(request, "user/new_signin.html", {"form": UserSigninForm()})
-                    login(request, user)
-                    messages.success(request, "Logged in successfully")
-                    if request.user.is_superuser or request.user.is_staff:
-                        return redirect("dashboard")
-                else:
-                    print("Authentication failed for user:", username)
-                    messages.error(request, "Invalid credentials")
-
-                return render(request, "user/new_signin.html", {"form": UserSigninForm()})
-            else:
-                print("Signin form errors:", form.errors)
-                return render(request, "user/new_signin.html", {"form": form})
-        except Exception as e:
-            print(str(e))
-        return render(request, "user/new_signin.html", {"form": UserSigninForm()})
-    else:
-        return render(request, "user/new_signin.html", {"form": UserSigninForm()})
+        return HttpResponseRedirect(_url("dashboard"))
+
+    if request.method != "POST":
+        return _render_signin(request)
+
+    form = UserSigninForm(request.POST)
+    try:
+        if not form.is_valid():
+            logger.debug("Signin form errors: %s", form.errors)
+            # Credential and soft-delete failures come from UserSigninForm.clean()
+            auth_errors = form.non_field_errors()
+            if auth_errors:
+                logger.warning("Authentication failed for user=%s", form.cleaned_data.get("username"))
+            for error in auth_errors:
+                messages.error(request, error)
+            return _render_signin(request, form)
+
+        # Already authenticated (and hashed once) by the form
+        login(request, form.get_user())
+        messages.success(request, "Logged in successfully")
+        if request.user.is_superuser or request.user.is_staff:
+            return HttpResponseRedirect(_url("dashboard"))
+    except (DatabaseError, ValidationError):
+        logger.warning("Sign-in failed unexpectedly", exc_info=True)
+    return _render_signin(request)
 
 
 def Logout(request):
     if request.user.is_authenticated:
         logout(request)
-    return redirect("/sign_in")
+    return HttpResponseRedirect(_url("sign_in"))
 
 
 # ---------------------------------------------------------------------------
 # CMS User Management
 # ---------------------------------------------------------------------------
 
-@login_required(login_url="/sign_in")
+@login_required
+@cms_role_required(_is_staff_superuser)
 def delete_user_view(request, id):
-    user = get_object_or_404(User, id=id)
-    if request.user.is_authenticated and request.user.is_staff and request.user.is_superuser:
-        user.deleted_at = datetime.now()
-        user.save()
-    return redirect("userList")
+    # Single-column UPDATE, no fetch; .update() sends no signals, so drop the dashboard cache here
+    if not User.objects.filter(pk=id).update(deleted_at=timezone.now()):
+        raise Http404("User not found")
+    delete_cache(dashboard_cache_key())
+    return HttpResponseRedirect(_url("userList"))
 
 
-@login_required(login_url="/sign_in")
+@login_required
+@cms_role_required(_is_staff)
 def restore_user_view(request, id):
-    user = get_object_or_404(User, id=id)
-    if request.user.is_authenticated and request.user.is_staff:
-        user.deleted_at = None
-        user.save()
-        messages.success(request, "User restored successfully")
-    return redirect("userList")
+    if not User.objects.filter(pk=id).update(deleted_at=None):
+        raise Http404("User not found")
+    delete_cache(dashboard_cache_key())
+    messages.success(request, "User restored successfully")
+    return HttpResponseRedirect(_url("userList"))
 
 
-@login_required(login_url="/sign_in")
+# Columns rendered by user/list.html (plus pk); skips password hashes and unused profile fields
+USER_LIST_FIELDS = ("username", "first_name", "last_name", "email", "is_superuser", "is_staff", "deleted_at")
+USER_LIST_PAGE_SIZE = 50
+
+
+@login_required
 def user_list_view(request):
-    users = User.objects.all()
-    return render(request, "user/list.html", {"users": users})
+    users = User.objects.only(*USER_LIST_FIELDS).order_by("-id")
+    page_obj = Paginator(users, USER_LIST_PAGE_SIZE).get_page(request.GET.get("page"))
+    return render(request, "user/list.html", {"users": page_obj, "page_obj": page_obj})
 
 
-@login_required(login_url="/sign_in")
+@login_required
+@cms_role_required(_is_superuser, "Unauthorized access (Only SuperUser can add a user)")
 def add_user_view(request):
-    if (
-        request.user
-        and request.user.is_authenticated
-        and request.user.is_staff
-        and not request.user.is_superuser
-    ):
-        messages.error(request, "Unauthorized access (Staff cannot add a user)")
-        return redirect("userList")
-
     if request.method == "POST":
         form = AddUser(request.POST)
         if form.is_valid():
-            if request.user.is_superuser:
-                role = form.cleaned_data.get("user_role")
-                is_superuser = role == "superuser"
-                is_staff = role in ("superuser", "staff")
-                new_user = User.objects.create(
-                    username=form.cleaned_data.get("username"),
-                    email=form.cleaned_data.get("email"),
-                    first_name=form.cleaned_data.get("first_name"),
-                    last_name=form.cleaned_data.get("last_name"),
-                    is_staff=is_staff,
-                    is_superuser=is_superuser,
-                )
-                new_user.set_password(form.cleaned_data.get("password"))
-                new_user.save()
-                messages.success(request, "User added successfully")
-                return redirect("userList")
-            messages.error(request, "Only SuperUser can add a user")
+            role = form.cleaned_data.get("user_role")
+            is_superuser = role == "superuser"
+            is_staff = role in ("superuser", "staff")
+            # Hash before the first save so the row is written with a single INSERT
+            new_user = User(
+                username=form.cleaned_data.get("username"),
+                email=form.cleaned_data.get("email"),
+                first_name=form.cleaned_data.get("first_name"),
+                last_name=form.cleaned_data.get("last_name"),
+                is_staff=is_staff,
+                is_superuser=is_superuser,
+            )
+            new_user.set_password(form.cleaned_data.get("password"))
+            new_user.save(force_insert=True)
+            messages.success(request, "User added successfully")
+            return HttpResponseRedirect(_url("userList"))
     else:
         form = AddUser()
 
     return render(request, "user/add_user.html", {"form": form})
 
 
-@login_required(login_url="/sign_in")
+# Fields exposed to update_user.html as user_data; all loaded by get_user_for_edit, so no deferred fetch
+USER_EDIT_DATA_FIELDS = ("id", *UpdateUser.instance_fields)
+
+
+@login_required
 def update_user_view(request, id):
-    user = get_object_or_404(User, id=id)
+    user = get_user_for_edit(id)
 
     if request.method == "POST":
         form = UpdateUser(request.POST)
         if form.is_valid():
             if not request.user.is_superuser and form.cleaned_data.get("user_role") == "superuser":
                 messages.error(request, "Unauthorized access (Staff cannot assign SuperUser role)")
-                return redirect("userList")
+                return HttpResponseRedirect(_url("userList"))
 
             password = form.cleaned_data.get("password")
             confirm_password = form.cleaned_data.get("confirm_password")
 
             if password and password != confirm_password:
                 form.add_error("confirm_password", "Password and Confirm Password should match")
-                return render(request, "user/update_user.html", {"form": form, "user_data": user})
+                user_data = model_to_dict(user, fields=USER_EDIT_DATA_FIELDS)
+                return render(request, "user/update_user.html", {"form": form, "user_data": user_data})
 
             if password:
                 user.set_password(password)
@@ -207,11 +244,11 @@ def update_user_view(request, id):
                 user.is_staff = True
             user.save()
             messages.success(request, "User updated successfully")
-            return redirect("userList")
+            return HttpResponseRedirect(_url("userList"))
     else:
         form = UpdateUser(instance=user)
 
-    user_data = {k: v for k, v in user.__dict__.items() if k != "password"}
+    user_data = model_to_dict(user, fields=USER_EDIT_DATA_FIELDS)
     return render(request, "user/update_user.html", {"form": form, "user_data": user_data})
 
 
@@ -219,12 +256,12 @@ def update_user_view(request, id):
 # TODO: Add your project-specific CMS views below, e.g.:
 # ---------------------------------------------------------------------------
 #
-# @login_required(login_url="/sign_in")
+# @login_required
 # def item_list_view(request):
 #     items = Item.objects.filter(is_active=True).order_by("-created_at")
 #     return render(request, "item/list.html", {"items": items})
 #
-# @login_required(login_url="/sign_in")
+# @login_required
 # def item_update_view(request, pk):
 #     item = get_object_or_404(Item, pk=pk)
 #     if request.method == "POST":
@@ -232,7 +269,7 @@ def update_user_view(request, id):
 #         if form.is_valid():
 #             form.save()
 #             messages.success(request, "Item updated successfully")
-#             return redirect("itemList")
+#             return HttpResponseRedirect(_url("itemList"))
 #     else:
 #         form = AddItemForm(instance=item)
 #     return render(request, "item/update.html", {"form": form, "item": item})
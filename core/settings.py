@@ -48,6 +48,13 @@ JWT_ACCESS_TTL = timedelta(minutes=int(os.getenv("JWT_ACCESS_TTL", "60")))
 JWT_REFRESH_TTL = timedelta(days=int(os.getenv("JWT_REFRESH_TTL", "7")))
 
 
+# CMS sign-in
+# When true, the sign-in form rejects unknown usernames with a cheap EXISTS query
+# instead of running the password hasher. Faster, but response timing then reveals
+# which usernames exist — only enable for internal/trusted deployments.
+SKIP_TIMING_EQUALIZATION = os.getenv("SKIP_TIMING_EQUALIZATION", "False").lower() == "true"
+
+
 # AWS S3 Configuration
 AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
 AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
@@ -99,15 +106,40 @@ CACHES = {
         "LOCATION": os.getenv("REDIS_URL", "redis://127.0.0.1:6379/0"),
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            # One shared pool per process, sized for the worker's concurrency
+            "CONNECTION_POOL_KWARGS": {
+                "max_connections": int(os.getenv("REDIS_MAX_CONNECTIONS", "200")),
+                "retry_on_timeout": True,
+            },
+            # Fail fast instead of stalling a worker when Redis is unreachable (seconds)
+            "SOCKET_CONNECT_TIMEOUT": 1,
+            "SOCKET_TIMEOUT": 1,
         }
     }
 }
 
+# Where @login_required sends anonymous CMS users (URL name, resolved on use)
+LOGIN_URL = "sign_in"
+
+# CMS sessions are read from Redis and only fall back to the DB on a cache miss,
+# so authenticated CMS requests don't cost a session SELECT each time.
+# api.sessions is cached_db with Redis errors downgraded to cache misses, so a
+# Redis outage falls back to plain DB sessions instead of failing requests.
+# (Flash messages use the cookie-first FallbackStorage and rarely touch the session.)
+SESSION_ENGINE = "api.sessions"
+
+# CMS dashboard stats cache lifetime (seconds); also invalidated on User/Device changes
+DASHBOARD_CACHE_TTL = int(os.getenv("DASHBOARD_CACHE_TTL", "300"))
+# true = show the device total from InnoDB's table estimate instead of COUNT(*)
+# (MySQL only; approximate). Keep False where exact numbers matter.
+DASHBOARD_APPROX_COUNTS = os.getenv("DASHBOARD_APPROX_COUNTS", "False").lower() == "true"
+
 # Django Cron Configuration
-# TODO: Register your cron job classes here, e.g.:
-# CRON_CLASSES = [
-#     "api.cron.example_cron.ExampleCronJob",
-# ]
+CRON_CLASSES = [
+    "api.cron.dashboard_cron.DashboardStatsCronJob",
+    # TODO: Register your cron job classes here, e.g.:
+    # "api.cron.example_cron.ExampleCronJob",
+]
 
 # REST Framework Configuration
 REST_FRAMEWORK = {
@@ -225,6 +257,9 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = 'core.urls'
 
+# No explicit "loaders": since Django 4.1 the default filesystem/app_directories
+# loaders are wrapped in the cached loader (DEBUG included), so templates are
+# compiled once per process.
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
@@ -244,6 +279,25 @@ TEMPLATES = [
 WSGI_APPLICATION = 'core.wsgi.application'
 
 
+# Logging
+# App loggers ("api.*") write to stderr; set DJANGO_LOG_LEVEL=DEBUG to see
+# rejected-auth diagnostics. Django's own loggers keep their defaults.
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "api": {
+            "handlers": ["console"],
+            "level": os.getenv("DJANGO_LOG_LEVEL", "WARNING"),
+            "propagate": False,
+        },
+    },
+}
+
+
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
@@ -255,6 +309,11 @@ DATABASES = {
         "PASSWORD": os.getenv("MYSQL_DB_PASSWORD"),
         "HOST": os.getenv("MYSQL_DB_HOST"),
         "PORT": os.getenv("MYSQL_DB_PORT"),
+        # Keep connections open between requests (seconds) instead of reconnecting
+        # every time; health checks re-validate a reused connection before use.
+        # Set DB_CONN_MAX_AGE=0 when an external pooler (e.g. ProxySQL) fronts MySQL.
+        "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": True,
         "OPTIONS": {
             "charset": "utf8mb4",
         },
@@ -281,6 +340,18 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing
+# Argon2id first; the others only verify existing hashes, which are re-hashed
+# with Argon2id on the next successful login.
+PASSWORD_HASHERS = [
+    "api.hashers.TunedArgon2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/4.2/topics/i18n/
 
@@ -4,7 +4,7 @@ URL configuration for core project.
 import os
 
 from api import views
-from api.health import HealthCheckView, ReadinessCheckView, LivenessCheckView
+from api.health import HealthCheckView, ReadinessCheckView, liveness_check
 from django.contrib import admin
 from django.urls import path, include
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
@@ -19,12 +19,15 @@ urlpatterns = [
     # Health Check and Monitoring Endpoints (Kubernetes / load-balancer probes)
     path("health/", HealthCheckView.as_view(), name="health-check"),
     path("health/ready/", ReadinessCheckView.as_view(), name="readiness-check"),
-    path("health/live/", LivenessCheckView.as_view(), name="liveness-check"),
+    path("health/live/", liveness_check, name="liveness-check"),
 
     # API Documentation (obfuscated URL - set API_DOCS_TOKEN env var)
-    path(f"api/{API_DOCS_TOKEN}/schema/", SpectacularAPIView.as_view(), name="schema"),
-    path(f"api/{API_DOCS_TOKEN}/docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
-    path(f"api/{API_DOCS_TOKEN}/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
+    # Grouped under one prefix so the resolver rejects non-docs paths with a single check
+    path(f"api/{API_DOCS_TOKEN}/", include([
+        path("schema/", SpectacularAPIView.as_view(), name="schema"),
+        path("docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
+        path("redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
+    ])),
 
     # CMS Authentication
     path("", views.dashboard_view, name="dashboard"),
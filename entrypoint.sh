@@ -24,5 +24,16 @@ then
     echo "yes" 
 fi
 
+if [ "$RUN_CRONS" = "true" ]
+then
+    # django_cron only runs jobs when runcrons is invoked; call it every minute
+    # in the background (see CRON_CLASSES in core/settings.py)
+    echo "Starting runcrons loop..."
+    while true; do
+        python3 manage.py runcrons
+        sleep 60
+    done &
+fi
+
 # Finally, start the actual server
 exec "$@"